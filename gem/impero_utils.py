@@ -32,8 +32,9 @@ class NoopError(Exception):
 def preprocess_gem(expressions, replace_delta=True, remove_componenttensors=True):
     """Lower GEM nodes that cannot be translated to C directly."""
     if remove_componenttensors:
-        expressions = optimise.remove_componenttensors(expressions)
-    if replace_delta:
+        # Lowers Deltas too in the same traversal if requested
+        expressions = optimise.remove_componenttensors(expressions, replace_delta=replace_delta)
+    elif replace_delta:
         expressions = optimise.replace_delta(expressions)
     return expressions
 
@@ -149,9 +149,30 @@ def filtered_replace_indices(node, self, subst):
     return replace_indices(node, self, filtered_subst)
 
 
-def remove_componenttensors(expressions):
-    """Removes all ComponentTensors in multi-root expression DAG."""
-    mapper = MemoizerArg(filtered_replace_indices)
+def filtered_replace_indices_delta(node, self, subst):
+    """Wrapper for :func:`filtered_replace_indices` which also lowers
+    Deltas after substitution, as :func:`replace_delta` does."""
+    if isinstance(node, Delta):
+        filtered_subst = tuple((k, v) for k, v in subst if k in node.free_indices)
+        result = replace_indices_delta(node, self, filtered_subst)
+        # Substitution may collapse the Delta to a literal
+        if isinstance(result, Delta):
+            result = _replace_delta_delta(result, self)
+        return result
+    return filtered_replace_indices(node, self, subst)
+
+
+def remove_componenttensors(expressions, replace_delta=False):
+    """Removes all ComponentTensors in multi-root expression DAG.
+
+    :arg replace_delta: also lower all Deltas in the same traversal,
+                        rather than calling :func:`replace_delta`
+                        afterwards
+    """
+    if replace_delta:
+        mapper = MemoizerArg(filtered_replace_indices_delta)
+    else:
+        mapper = MemoizerArg(filtered_replace_indices)
     return [mapper(expression, ()) for expression in expressions]
 
 
@@ -360,6 +381,28 @@ def make_sum(summands):
     return result
 
 
+def balanced_sum(summands):
+    """Constructs a sum of GEM expressions as a balanced binary tree.
+
+    Unlike ``reduce(Sum, summands)``, which builds a chain whose depth
+    is linear in the number of summands, the depth of the result is
+    logarithmic, so recursive visitors stay shallow.
+
+    :arg summands: iterable of scalar GEM expressions
+    :returns: GEM expression
+    """
+    summands = [s for s in summands if not isinstance(s, Zero)]
+    if not summands:
+        return Zero()
+    while len(summands) > 1:
+        pairs = [Sum(a, b) for a, b in zip(summands[::2], summands[1::2])]
+        if len(summands) % 2:
+            pairs.append(summands[-1])
+        summands = pairs
+    result, = summands
+    return result
+
+
 def make_product(factors, sum_indices=()):
     """Constructs an operation-minimal (tensor) product of GEM expressions."""
     return sum_factorise(sum_indices, factors)
@@ -1,4 +1,5 @@
 import collections
+from functools import singledispatch, update_wrapper
 
 
 # This is copied from PyOP2, and it is here to be available for both
@@ -20,6 +21,39 @@ class cached_property(object):
         return result
 
 
+def fast_singledispatch(function):
+    """Drop-in replacement for :func:`functools.singledispatch` with a
+    plain per-type lookup table in front of the registry.
+
+    Resolved handlers are cached in an ordinary :py:class:`dict` keyed
+    by the type of the first argument, which is cheaper to query than
+    the weak-reference cache of :func:`functools.singledispatch`.
+    Useful for hot recursive visitors.  The table is cleared whenever
+    a new handler is registered.
+    """
+    dispatcher = singledispatch(function)
+    table = {}
+
+    def wrapper(arg, *args, **kwargs):
+        try:
+            handler = table[arg.__class__]
+        except KeyError:
+            handler = table[arg.__class__] = dispatcher.dispatch(arg.__class__)
+        return handler(arg, *args, **kwargs)
+
+    def register(cls, func=None):
+        if func is None:
+            return lambda f: register(cls, f)
+        table.clear()
+        return dispatcher.register(cls, func)
+
+    wrapper.register = register
+    wrapper.dispatch = dispatcher.dispatch
+    wrapper.registry = dispatcher.registry
+    update_wrapper(wrapper, function)
+    return wrapper
+
+
 def groupby(iterable, key=None):
     """Groups objects by their keys.
 
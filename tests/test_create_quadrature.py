@@ -0,0 +1,29 @@
+import numpy
+import pytest
+
+from ufl import TensorProductCell, interval, quadrilateral, triangle
+
+from tsfc.kernel_interface.common import create_quadrature
+
+
+@pytest.mark.parametrize(('cell', 'integral_type'),
+                         [(triangle, 'cell'),
+                          (triangle, 'interior_facet'),
+                          (quadrilateral, 'cell'),
+                          (TensorProductCell(triangle, interval), 'interior_facet_horiz')])
+def test_create_quadrature(cell, integral_type):
+    rule1 = create_quadrature(cell, integral_type, 3)
+    rule2 = create_quadrature(cell, integral_type, 3)
+
+    # Same points...
+    assert type(rule1.point_set) == type(rule2.point_set)
+    assert numpy.array_equal(rule1.point_set.points, rule2.point_set.points)
+    # ...but different point indices, so that separate integrals
+    # keep separate quadrature loops.
+    assert not set(rule1.point_set.indices) & set(rule2.point_set.indices)
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
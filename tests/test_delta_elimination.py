@@ -1,7 +1,8 @@
 import pytest
 
-from gem.gem import Delta, Identity, Index, Indexed, one
-from gem.optimise import delta_elimination, remove_componenttensors
+from gem.gem import (ComponentTensor, Delta, Identity, Index, Indexed,
+                     Product, Variable, one)
+from gem.optimise import delta_elimination, remove_componenttensors, replace_delta
 
 
 def test_delta_elimination():
@@ -20,6 +21,28 @@ def test_delta_elimination():
     assert factors == [one, one, Indexed(I, (k, k))]
 
 
+def test_fused_replace_delta():
+    i = Index(extent=3)
+    j = Index(extent=3)
+    k = Index(extent=3)
+    A = Variable('A', (3,))
+
+    expr = Indexed(ComponentTensor(Product(Indexed(A, (i,)), Delta(i, j)), (i,)), (k,))
+
+    fused = remove_componenttensors([expr], replace_delta=True)
+    separate = replace_delta(remove_componenttensors([expr]))
+
+    assert fused == separate
+    assert fused == [Product(Indexed(A, (k,)), Indexed(Identity(3), (k, j)))]
+
+    # Substitution collapses the Delta
+    for expr in [Indexed(ComponentTensor(Delta(i, j), (i, j)), (0, 1)),
+                 Indexed(ComponentTensor(Delta(i, j), (i,)), (j,))]:
+        fused = remove_componenttensors([expr], replace_delta=True)
+        separate = replace_delta(remove_componenttensors([expr]))
+        assert fused == separate
+
+
 if __name__ == "__main__":
     import os
     import sys
@@ -0,0 +1,41 @@
+import pytest
+
+from ufl import (Coefficient, FiniteElement, FunctionSpace, Mesh,
+                 TestFunction, TrialFunction, VectorElement, dx, triangle)
+from ufl.algorithms import extract_arguments
+
+from tsfc.ufl_utils import entity_avg
+
+
+@pytest.fixture
+def space():
+    mesh = Mesh(VectorElement("P", triangle, 1))
+    return FunctionSpace(mesh, FiniteElement("P", triangle, 1))
+
+
+def test_single_argument_renumbered(space):
+    f = Coefficient(space)
+    u = TrialFunction(space)
+    integrand, degree, multiindices = entity_avg(f*u, dx, ("j", "k"))
+
+    assert multiindices == ("k",)
+    assert [a.number() for a in extract_arguments(integrand)] == [0]
+
+
+@pytest.mark.parametrize('arity', [0, 2])
+def test_arguments_unchanged(space, arity):
+    f = Coefficient(space)
+    if arity == 0:
+        expr = f*f
+    else:
+        expr = f*TestFunction(space)*TrialFunction(space)
+    integrand, degree, multiindices = entity_avg(expr, dx, ("j", "k"))
+
+    assert multiindices == ("j", "k")
+    assert [a.number() for a in extract_arguments(integrand)] == list(range(arity))
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
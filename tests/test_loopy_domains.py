@@ -0,0 +1,28 @@
+import islpy as isl
+import pytest
+
+from tsfc.loopy import create_domains
+
+
+def test_box_domain():
+    domain, = create_domains([("i", 3), ("j", 4)])
+    assert domain.get_var_names(isl.dim_type.set) == ["i", "j"]
+    assert domain.is_equal(isl.Set("{ [i, j] : 0 <= i < 3 and 0 <= j < 4 }"))
+
+
+def test_keyword_inames():
+    # ISL keywords must not be parsed as such
+    names = ["and", "or", "mod", "min", "max", "floor"]
+    domain, = create_domains([(name, 2) for name in names])
+    assert domain.get_var_names(isl.dim_type.set) == names
+
+
+def test_empty_domain():
+    domain, = create_domains([])
+    assert domain.dim(isl.dim_type.set) == 0
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
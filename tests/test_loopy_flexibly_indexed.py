@@ -0,0 +1,57 @@
+import pymbolic.primitives as p
+import pytest
+
+import gem
+from tsfc.loopy import LoopyContext, expression
+
+
+@pytest.fixture
+def indices():
+    return gem.Index(name='i', extent=3), gem.Index(name='j', extent=4)
+
+
+def convert(expr, indices):
+    ctx = LoopyContext()
+    ctx.active_indices = {index: p.Variable(index.name) for index in indices}
+    return expression(expr, ctx)
+
+
+def test_single_term(indices):
+    i, j = indices
+    A = gem.Variable('A', (3, 4))
+    expr = gem.FlexiblyIndexed(A, ((0, ((i, 1),)), (0, ((j, 1),))))
+    assert convert(expr, indices) == p.Subscript(p.Variable('A'), (p.Variable('i'), p.Variable('j')))
+
+
+def test_strided_terms(indices):
+    i, j = indices
+    u = gem.Variable('u', (12,))
+    expr = gem.FlexiblyIndexed(u, ((0, ((i, 4), (j, 1))),))
+    rank = p.Sum((p.Product((p.Variable('i'), 4)), p.Variable('j')))
+    assert convert(expr, indices) == p.Subscript(p.Variable('u'), (rank,))
+
+
+def test_offset(indices):
+    i, j = indices
+    u = gem.Variable('u', (16,))
+    expr = gem.FlexiblyIndexed(u, ((2, ((i, 1),)),))
+    assert convert(expr, indices) == p.Subscript(p.Variable('u'), (p.Sum((2, p.Variable('i'))),))
+
+
+def test_empty_dimension(indices):
+    i, j = indices
+    A = gem.Variable('A', (3, 1))
+    expr = gem.FlexiblyIndexed(A, ((0, ((i, 1),)), (0, ())))
+    assert convert(expr, indices) == p.Subscript(p.Variable('A'), (p.Variable('i'), 0))
+
+
+def test_fixed_offset_only(indices):
+    A = gem.Variable('A', (3, 4))
+    expr = gem.FlexiblyIndexed(A, ((1, ()), (2, ())))
+    assert convert(expr, indices) == p.Subscript(p.Variable('A'), (1, 2))
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
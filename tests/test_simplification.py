@@ -1,7 +1,8 @@
 import pytest
 
 from gem.gem import Variable, Zero, Conditional, \
-    LogicalAnd, Index, Indexed, Product
+    LogicalAnd, Index, Indexed, Product, Sum
+from gem.optimise import balanced_sum
 
 
 def test_conditional_simplification():
@@ -25,6 +26,17 @@ def test_conditional_zero_folding():
     assert expr == Zero()
 
 
+def test_balanced_sum():
+    summands = [Variable("A%d" % i, ()) for i in range(5)]
+
+    expr = balanced_sum(summands[:2] + [Zero()] + summands[2:])
+
+    assert expr == Sum(Sum(Sum(summands[0], summands[1]),
+                           Sum(summands[2], summands[3])),
+                       summands[4])
+    assert balanced_sum([Zero(), Zero()]) == Zero()
+
+
 if __name__ == "__main__":
     import os
     import sys
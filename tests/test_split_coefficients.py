@@ -0,0 +1,28 @@
+import pytest
+
+from ufl import (Coefficient, FiniteElement, FunctionSpace, Mesh,
+                 MixedElement, VectorElement, triangle)
+
+from tsfc.ufl_utils import split_coefficients
+
+
+def test_nothing_to_split():
+    mesh = Mesh(VectorElement("P", triangle, 1))
+    P1 = FiniteElement("P", triangle, 1)
+    V = FunctionSpace(mesh, P1)
+    W = FunctionSpace(mesh, MixedElement(P1, P1))
+
+    w = Coefficient(W)
+    split = {w: (Coefficient(V), Coefficient(V))}
+
+    f = Coefficient(V)
+    expr = f*f + f
+    assert split_coefficients(expr, split) is expr
+    assert split_coefficients(expr, {}) is expr
+    assert split_coefficients(expr, None) is expr
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
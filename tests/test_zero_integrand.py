@@ -0,0 +1,52 @@
+import pytest
+
+from ufl import (Coefficient, FiniteElement, FunctionSpace, Mesh,
+                 TestFunction, VectorElement, dx, triangle)
+from ufl.classes import Zero
+
+from tsfc.driver import compile_integral
+from tsfc.ufl_utils import compute_form_data
+
+
+def compile_with(integrals):
+    """Compile the single kernel of a two-integral linear form, keeping
+    only some of its integrals.
+
+    :arg integrals: callable mapping the list of integrals to the list
+        of integrals to compile
+    """
+    mesh = Mesh(VectorElement("P", triangle, 1))
+    V = FunctionSpace(mesh, FiniteElement("P", triangle, 1))
+    f = Coefficient(V)
+    v = TestFunction(V)
+    # Different degrees keep the integrals apart
+    form = f*v*dx(degree=1) + f**2*v*dx(degree=2)
+
+    fd = compute_form_data(form)
+    integral_data, = fd.integral_data
+    assert len(integral_data.integrals) == 2
+    integral_data.integrals = integrals(integral_data.integrals)
+    return compile_integral(integral_data, fd, "form", None)
+
+
+def zero(integral):
+    return integral.reconstruct(integrand=Zero())
+
+
+def test_all_integrands_zero():
+    kernel = compile_with(lambda integrals: [zero(integral) for integral in integrals])
+    # Firedrake needs no empty kernels
+    assert kernel is None
+
+
+def test_one_integrand_zero():
+    kernel = compile_with(lambda integrals: [zero(integrals[0]), integrals[1]])
+    expected = compile_with(lambda integrals: [integrals[1]])
+    assert kernel is not None
+    assert kernel.ast.gencode() == expected.ast.gencode()
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    pytest.main(args=[os.path.abspath(__file__)] + sys.argv[1:])
@@ -1,8 +1,8 @@
-from functools import partial, reduce
+from functools import partial
 
 from gem.node import traversal, Memoizer
-from gem.gem import Failure, Sum, index_sum
-from gem.optimise import replace_division, unroll_indexsum
+from gem.gem import Failure, index_sum
+from gem.optimise import balanced_sum, replace_division, unroll_indexsum
 from gem.refactorise import collect_monomials
 from gem.unconcatenate import unconcatenate
 from gem.coffee import optimise_monomial_sum
@@ -43,7 +43,7 @@ def flatten(var_reps, index_cache):
 
     :returns: series of (return variable, GEM expression root) pairs
     """
-    assignments = unconcatenate([(variable, reduce(Sum, reps))
+    assignments = unconcatenate([(variable, balanced_sum(reps))
                                  for variable, reps in var_reps],
                                 cache=index_cache)
 
@@ -7,7 +7,7 @@ from finat.physically_mapped import DirectlyDefinedElement, PhysicallyMappedElem
 import ufl
 from ufl.algorithms import extract_arguments, extract_coefficients
 from ufl.algorithms.analysis import has_type
-from ufl.classes import Form, GeometricQuantity
+from ufl.classes import Form, GeometricQuantity, Zero
 from ufl.log import GREEN
 
 import gem
@@ -133,10 +133,18 @@ def compile_integral(integral_data, form_data, prefix, parameters, interface, co
     builder.set_cell_sizes(mesh)
     builder.set_coefficients(integral_data, form_data)
     ctx = builder.create_context()
+    # Replacing coefficients is a no-op walk over the integrand if
+    # none of the integrals refer to any.
+    function_replace_map = form_data.function_replace_map if integral_data.integral_coefficients else None
     for integral in integral_data.integrals:
         params = parameters.copy()
         params.update(integral.metadata())  # integral metadata overrides
-        integrand = ufl.replace(integral.integrand(), form_data.function_replace_map)
+        integrand = integral.integrand()
+        if function_replace_map:
+            integrand = ufl.replace(integrand, function_replace_map)
+        if isinstance(integrand, Zero):
+            # Nothing to compile, skip quadrature and GEM construction
+            continue
         integrand_exprs = builder.compile_integrand(integrand, params, ctx)
         integral_exprs = builder.construct_integrals(integrand_exprs, params)
         builder.stash_integrals(integral_exprs, params, ctx)
@@ -57,6 +57,8 @@ class ContextBase(ProxyKernelInterface):
                 'argument_multiindices',
                 'facetarea',
                 'index_cache',
+                'simplify_abs_cache',
+                'one_times_cache',
                 'scalar_type')
 
     def __init__(self, interface, **kwargs):
@@ -108,6 +110,14 @@ class ContextBase(ProxyKernelInterface):
     def index_cache(self):
         return {}
 
+    @cached_property
+    def simplify_abs_cache(self):
+        return {}
+
+    @cached_property
+    def one_times_cache(self):
+        return {}
+
     @cached_property
     def translator(self):
         # NOTE: reference cycle!
@@ -143,7 +153,8 @@ class CoordinateMapping(PhysicalGeometry):
     @property
     def config(self):
         config = {name: getattr(self.interface, name)
-                  for name in ["ufl_cell", "index_cache", "scalar_type"]}
+                  for name in ["ufl_cell", "index_cache", "scalar_type",
+                               "simplify_abs_cache", "one_times_cache"]}
         config["interface"] = self.interface
         return config
 
@@ -337,7 +348,8 @@ class Translator(MultiFunction, ModifiedTerminalMixin, ufl2gem.Mixin):
         integrand, degree, argument_multiindices = entity_avg(integrand / CellVolume(domain), measure, self.context.argument_multiindices)
 
         config = {name: getattr(self.context, name)
-                  for name in ["ufl_cell", "index_cache", "scalar_type"]}
+                  for name in ["ufl_cell", "index_cache", "scalar_type",
+                               "simplify_abs_cache", "one_times_cache"]}
         config.update(quadrature_degree=degree, interface=self.context,
                       argument_multiindices=argument_multiindices)
         expr, = compile_ufl(integrand, PointSetContext(**config), point_sum=True)
@@ -354,7 +366,8 @@ class Translator(MultiFunction, ModifiedTerminalMixin, ufl2gem.Mixin):
         config = {name: getattr(self.context, name)
                   for name in ["ufl_cell", "index_cache", "scalar_type",
                                "integration_dim", "entity_ids",
-                               "integral_type"]}
+                               "integral_type", "simplify_abs_cache",
+                               "one_times_cache"]}
         config.update(quadrature_degree=degree, interface=self.context,
                       argument_multiindices=argument_multiindices)
         expr, = compile_ufl(integrand, PointSetContext(**config), point_sum=True)
@@ -511,11 +524,13 @@ class CellVolumeKernelInterface(ProxyKernelInterface):
 
 @translate.register(CellVolume)
 def translate_cellvolume(terminal, mt, ctx):
-    integrand, degree = one_times(ufl.dx(domain=terminal.ufl_domain()))
+    integrand, degree = one_times(ufl.dx(domain=terminal.ufl_domain()),
+                                  cache=ctx.one_times_cache)
     interface = CellVolumeKernelInterface(ctx, mt.restriction)
 
     config = {name: getattr(ctx, name)
-              for name in ["ufl_cell", "index_cache", "scalar_type"]}
+              for name in ["ufl_cell", "index_cache", "scalar_type",
+                           "simplify_abs_cache", "one_times_cache"]}
     config.update(interface=interface, quadrature_degree=degree)
     expr, = compile_ufl(integrand, PointSetContext(**config), point_sum=True)
     return expr
@@ -525,11 +540,13 @@ def translate_cellvolume(terminal, mt, ctx):
 def translate_facetarea(terminal, mt, ctx):
     assert ctx.integral_type != 'cell'
     domain = terminal.ufl_domain()
-    integrand, degree = one_times(ufl.Measure(ctx.integral_type, domain=domain))
+    integrand, degree = one_times(ufl.Measure(ctx.integral_type, domain=domain),
+                                  cache=ctx.one_times_cache)
 
     config = {name: getattr(ctx, name)
               for name in ["ufl_cell", "integration_dim", "scalar_type",
-                           "entity_ids", "index_cache"]}
+                           "entity_ids", "index_cache",
+                           "simplify_abs_cache", "one_times_cache"]}
     config.update(interface=ctx, quadrature_degree=degree)
     expr, = compile_ufl(integrand, PointSetContext(**config), point_sum=True)
     return expr
@@ -543,7 +560,8 @@ def translate_cellorigin(terminal, mt, ctx):
     point_set = PointSingleton((0.0,) * domain.topological_dimension())
 
     config = {name: getattr(ctx, name)
-              for name in ["ufl_cell", "index_cache", "scalar_type"]}
+              for name in ["ufl_cell", "index_cache", "scalar_type",
+                           "simplify_abs_cache", "one_times_cache"]}
     config.update(interface=ctx, point_set=point_set)
     context = PointSetContext(**config)
     return context.translator(expression)
@@ -556,7 +574,8 @@ def translate_cell_vertices(terminal, mt, ctx):
     ps = PointSet(numpy.array(ctx.fiat_cell.get_vertices()))
 
     config = {name: getattr(ctx, name)
-              for name in ["ufl_cell", "index_cache", "scalar_type"]}
+              for name in ["ufl_cell", "index_cache", "scalar_type",
+                           "simplify_abs_cache", "one_times_cache"]}
     config.update(interface=ctx, point_set=ps)
     context = PointSetContext(**config)
     expr = context.translator(ufl_expr)
@@ -706,7 +725,8 @@ def compile_ufl(expression, context, interior_facet=False, point_sum=False):
    """
 
     # Abs-simplification
-    expression = simplify_abs(expression, context.complex_mode)
+    expression = simplify_abs(expression, context.complex_mode,
+                              cache=context.simplify_abs_cache)
     if interior_facet:
         expressions = []
         for rs in itertools.product(("+", "-"), repeat=len(context.argument_multiindices)):
@@ -1,6 +1,5 @@
 import abc
 
-import coffee.base as coffee
 import loopy as lp
 
 
@@ -18,10 +17,10 @@ class KernelArg(abc.ABC):
 
     @property
     def dtype(self):
-        if self._is_coffee_backend:
-            return self._ast_arg.typ
-        elif self._is_loopy_backend:
+        if self._is_loopy_backend:
             return self._ast_arg.dtype
+        elif self._is_coffee_backend:
+            return self._ast_arg.typ
 
     @property
     def coffee_arg(self):
@@ -37,6 +36,8 @@ class KernelArg(abc.ABC):
 
     @property
     def _is_coffee_backend(self):
+        # Delayed import, only COFFEE arguments need COFFEE
+        import coffee.base as coffee
         return isinstance(self._ast_arg, coffee.Decl)
 
     @property
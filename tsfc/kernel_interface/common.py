@@ -1,7 +1,7 @@
 import collections
 import string
 import operator
-from functools import reduce
+from functools import lru_cache, reduce
 from itertools import chain
 
 import numpy
@@ -9,14 +9,14 @@ from numpy import asarray
 
 from ufl.utils.sequences import max_degree
 
-import coffee.base as coffee
-
 from FIAT.reference_element import TensorProductCell
 
-from finat.quadrature import AbstractQuadratureRule, make_quadrature
+from finat.quadrature import (AbstractQuadratureRule, QuadratureRule,
+                              TensorProductQuadratureRule, make_quadrature)
 
 import gem
 
+from gem.node import traversal
 from gem.utils import cached_property
 import gem.impero_utils as impero_utils
 
@@ -112,6 +112,9 @@ class KernelBuilderBase(KernelInterface):
         :arg body: function body (:class:`coffee.Block` node)
         :returns: :class:`coffee.FunDecl` object
         """
+        # Delayed import, only COFFEE based kernel builders need COFFEE
+        import coffee.base as coffee
+
         assert isinstance(body, coffee.Block)
         body_ = coffee.Block(self.prepare + body.children + self.finalise)
         return coffee.FunDecl("void", name, args, body_, pred=["static", "inline"])
@@ -150,10 +153,14 @@ class KernelBuilderMixin(object):
         config['argument_multiindices'] = self.argument_multiindices
         config['quadrature_rule'] = quad_rule
         config['index_cache'] = ctx['index_cache']
+        config['simplify_abs_cache'] = ctx['simplify_abs_cache']
+        config['one_times_cache'] = ctx['one_times_cache']
         expressions = fem.compile_ufl(integrand,
                                       fem.PointSetContext(**config),
                                       interior_facet=self.interior_facet)
-        ctx['quadrature_indices'].extend(quad_rule.point_set.indices)
+        # Integrals may be given the same quadrature rule
+        ctx['quadrature_indices'].extend(index for index in quad_rule.point_set.indices
+                                         if index not in ctx['quadrature_indices'])
         return expressions
 
     def construct_integrals(self, integrand_expressions, params):
@@ -213,9 +220,13 @@ class KernelBuilderMixin(object):
             expressions = []
 
         # Need optimised roots
-        options = dict(reduce(operator.and_,
-                              [mode.finalise_options.items()
-                               for mode in mode_irs.keys()]))
+        if mode_irs:
+            options = dict(reduce(operator.and_,
+                                  [mode.finalise_options.items()
+                                   for mode in mode_irs.keys()]))
+        else:
+            # All integrals were skipped
+            options = {}
         expressions = impero_utils.preprocess_gem(expressions, **options)
 
         # Let the kernel interface inspect the optimised IR to register
@@ -265,9 +276,20 @@ class KernelBuilderMixin(object):
         caches shall never conflict as their keys have different types
         (UFL finite elements vs. GEM index objects).
 
+        *simplify_abs_cache*
+
+        Memoisation cache for :func:`tsfc.ufl_utils.simplify_abs`, so
+        subexpressions shared between the integrands of a kernel are
+        only simplified once.
+
+        *one_times_cache*
+
+        Map from UFL measures to the preprocessed integrand and degree
+        of ``1*measure``, see :func:`tsfc.ufl_utils.one_times`.
+
         *quadrature_indices*
 
-        List of quadrature indices used.
+        List of quadrature indices used, without duplicates.
 
         *mode_irs*
 
@@ -294,6 +316,8 @@ class KernelBuilderMixin(object):
 
         """
         return {'index_cache': {},
+                'simplify_abs_cache': {},
+                'one_times_cache': {},
                 'quadrature_indices': [],
                 'mode_irs': collections.OrderedDict()}
 
@@ -317,10 +341,7 @@ def set_quad_rule(params, cell, integral_type, functions):
     try:
         quad_rule = params["quadrature_rule"]
     except KeyError:
-        fiat_cell = as_fiat_cell(cell)
-        integration_dim, _ = lower_integral_type(fiat_cell, integral_type)
-        integration_cell = fiat_cell.construct_subelement(integration_dim)
-        quad_rule = make_quadrature(integration_cell, quadrature_degree)
+        quad_rule = create_quadrature(cell, integral_type, quadrature_degree)
         params["quadrature_rule"] = quad_rule
 
     if not isinstance(quad_rule, AbstractQuadratureRule):
@@ -328,6 +349,57 @@ def set_quad_rule(params, cell, integral_type, functions):
                          type(quad_rule))
 
 
+def create_quadrature(cell, integral_type, degree):
+    """Create a quadrature rule for integrating over the entities of
+    a cell that an integral type refers to.
+
+    Points and weights are only computed once for each cell, integral
+    type and degree, but every call returns a new rule with its own
+    point indices.
+
+    :arg cell: UFL cell
+    :arg integral_type: integral type (string)
+    :arg degree: quadrature degree
+    :returns: a FInAT quadrature rule
+    """
+    return _fresh_quadrature(_default_quadrature(cell, integral_type, degree))
+
+
+@lru_cache(maxsize=128)
+def _default_quadrature(cell, integral_type, degree):
+    fiat_cell = as_fiat_cell(cell)
+    integration_dim, _ = lower_integral_type(fiat_cell, integral_type)
+    integration_cell = fiat_cell.construct_subelement(integration_dim)
+    return make_quadrature(integration_cell, degree)
+
+
+def _fresh_quadrature(rule):
+    """Copy a quadrature rule with new point sets, sharing the point
+    and weight arrays."""
+    if isinstance(rule, TensorProductQuadratureRule):
+        return TensorProductQuadratureRule([_fresh_quadrature(factor)
+                                            for factor in rule.factors])
+    point_set = rule.point_set
+    return QuadratureRule(type(point_set)(point_set.points), rule.weights)
+
+
+def check_requirements(ir):
+    """Look for cell orientations, cell sizes, and collect tabulations
+    in one pass."""
+    cell_orientations = False
+    cell_sizes = False
+    rt_tabs = {}
+    for node in traversal(ir):
+        if isinstance(node, gem.Variable):
+            if node.name == "cell_orientations":
+                cell_orientations = True
+            elif node.name == "cell_sizes":
+                cell_sizes = True
+            elif node.name.startswith("rt_"):
+                rt_tabs[node.name] = node.shape
+    return cell_orientations, cell_sizes, tuple(sorted(rt_tabs.items()))
+
+
 def get_index_ordering(quadrature_indices, return_variables):
     split_argument_indices = tuple(chain(*[var.index_ordering()
                                            for var in return_variables]))
@@ -8,13 +8,12 @@ import coffee.base as coffee
 
 import gem
 from gem.flop_count import count_flops
-from gem.node import traversal
 from gem.optimise import remove_componenttensors as prune
 
 from tsfc import kernel_args
 from tsfc.coffee import generate as generate_coffee
 from tsfc.finatinterface import create_element
-from tsfc.kernel_interface.common import KernelBuilderBase as _KernelBuilderBase, KernelBuilderMixin, get_index_names
+from tsfc.kernel_interface.common import KernelBuilderBase as _KernelBuilderBase, KernelBuilderMixin, get_index_names, check_requirements
 
 
 def make_builder(*args, **kwargs):
@@ -292,23 +291,6 @@ class KernelBuilder(KernelBuilderBase, KernelBuilderMixin):
         return None
 
 
-def check_requirements(ir):
-    """Look for cell orientations, cell sizes, and collect tabulations
-    in one pass."""
-    cell_orientations = False
-    cell_sizes = False
-    rt_tabs = {}
-    for node in traversal(ir):
-        if isinstance(node, gem.Variable):
-            if node.name == "cell_orientations":
-                cell_orientations = True
-            elif node.name == "cell_sizes":
-                cell_sizes = True
-            elif node.name.startswith("rt_"):
-                rt_tabs[node.name] = node.shape
-    return cell_orientations, cell_sizes, tuple(sorted(rt_tabs.items()))
-
-
 def prepare_coefficient(coefficient, name, scalar_type, interior_facet=False):
     """Bridges the kernel interface and the GEM abstraction for
     Coefficients.
@@ -13,8 +13,7 @@ import loopy as lp
 
 from tsfc import kernel_args
 from tsfc.finatinterface import create_element
-from tsfc.kernel_interface.common import KernelBuilderBase as _KernelBuilderBase, KernelBuilderMixin, get_index_names
-from tsfc.kernel_interface.firedrake import check_requirements
+from tsfc.kernel_interface.common import KernelBuilderBase as _KernelBuilderBase, KernelBuilderMixin, get_index_names, check_requirements
 from tsfc.loopy import generate as generate_loopy
 
 
@@ -3,11 +3,13 @@
 This is the final stage of code generation in TSFC."""
 
 import numpy
-from functools import singledispatch
+import operator
 from collections import defaultdict, OrderedDict
+from functools import lru_cache, reduce
 
 from gem import gem, impero as imp
 from gem.node import Memoizer
+from gem.utils import fast_singledispatch
 
 import islpy as isl
 import loopy as lp
@@ -39,54 +41,64 @@ def profile_insns(kernel_name, instructions, log=False):
         return instructions, None, None
 
 
-@singledispatch
+# Interned dtype for logical expressions
+_INT8 = numpy.dtype(numpy.int8)
+
+
+@lru_cache(maxsize=None)
+def _finfo(scalar_type):
+    """Cached :class:`numpy.finfo`, which is slow to construct."""
+    return numpy.finfo(scalar_type)
+
+
+@fast_singledispatch
 def _assign_dtype(expression, self):
-    return set.union(*map(self, expression.children))
+    return frozenset.union(*map(self, expression.children))
 
 
 @_assign_dtype.register(gem.Terminal)
 def _assign_dtype_terminal(expression, self):
-    return {self.scalar_type}
+    return self.scalar_type
 
 
 @_assign_dtype.register(gem.Zero)
 @_assign_dtype.register(gem.Identity)
 @_assign_dtype.register(gem.Delta)
 def _assign_dtype_real(expression, self):
-    return {self.real_type}
+    return self.real_type
 
 
 @_assign_dtype.register(gem.Literal)
 def _assign_dtype_identity(expression, self):
-    return {expression.array.dtype}
+    return frozenset([expression.array.dtype])
 
 
 @_assign_dtype.register(gem.Power)
 def _assign_dtype_power(expression, self):
     # Conservative
-    return {self.scalar_type}
+    return self.scalar_type
 
 
 @_assign_dtype.register(gem.MathFunction)
 def _assign_dtype_mathfunction(expression, self):
     if expression.name in {"abs", "real", "imag"}:
-        return {self.real_type}
+        return self.real_type
     elif expression.name == "sqrt":
-        return {self.scalar_type}
+        return self.scalar_type
     else:
-        return set.union(*map(self, expression.children))
+        return frozenset.union(*map(self, expression.children))
 
 
 @_assign_dtype.register(gem.MinValue)
 @_assign_dtype.register(gem.MaxValue)
 def _assign_dtype_minmax(expression, self):
     # UFL did correctness checking
-    return {self.real_type}
+    return self.real_type
 
 
 @_assign_dtype.register(gem.Conditional)
 def _assign_dtype_conditional(expression, self):
-    return set.union(*map(self, expression.children[1:]))
+    return frozenset.union(*map(self, expression.children[1:]))
 
 
 @_assign_dtype.register(gem.Comparison)
@@ -94,7 +106,19 @@ def _assign_dtype_conditional(expression, self):
 @_assign_dtype.register(gem.LogicalAnd)
 @_assign_dtype.register(gem.LogicalOr)
 def _assign_dtype_logical(expression, self):
-    return {numpy.int8}
+    return self.logical_type
+
+
+def _common_dtype(dtypes):
+    """Pick the data type all of ``dtypes`` can be safely cast to.
+
+    :arg dtypes: non-empty set of numpy data types.
+    :returns: a numpy data type."""
+    if len(dtypes) == 1:
+        # Common case, no promotion needed
+        dtype, = dtypes
+        return dtype
+    return numpy.result_type(*dtypes)
 
 
 def assign_dtypes(expressions, scalar_type):
@@ -106,19 +130,24 @@ def assign_dtypes(expressions, scalar_type):
     :arg scalar_type: Default scalar type.
 
     :returns: list of tuples (expression, dtype)."""
+    # Handlers return shared singleton sets, so that the recursion does
+    # not allocate a fresh set for every terminal.
     mapper = Memoizer(_assign_dtype)
-    mapper.scalar_type = scalar_type
-    mapper.real_type = numpy.finfo(scalar_type).dtype
-    return [(e, numpy.find_common_type(mapper(e), [])) for e in expressions]
+    mapper.scalar_type = frozenset([numpy.dtype(scalar_type)])
+    mapper.real_type = frozenset([_finfo(scalar_type).dtype])
+    mapper.logical_type = frozenset([_INT8])
+    return [(e, _common_dtype(mapper(e))) for e in expressions]
 
 
 class LoopyContext(object):
     def __init__(self, target=None):
         self.indices = {}  # indices for declarations and referencing values, from ImperoC
         self.active_indices = {}  # gem index -> pymbolic variable
+        self._active_inames = frozenset()  # cached names of active indices, None if stale
         self.index_extent = OrderedDict()  # pymbolic variable for indices -> extent
         self.gem_to_pymbolic = {}  # gem node -> pymbolic variable
         self.name_gen = UniqueNameGenerator()
+        self.arg_names = frozenset()  # names of the kernel arguments
         self.target = target
 
     def fetch_multiindex(self, multiindex):
@@ -135,23 +164,30 @@ class LoopyContext(object):
 
     # Generate index from gem multiindex
     def gem_to_pym_multiindex(self, multiindex):
+        name_gen = self.name_gen
+        index_names = self.index_names
+        index_extent = self.index_extent
         indices = []
         for index in multiindex:
             assert index.extent
             if not index.name:
-                name = self.name_gen(self.index_names[index])
+                name = name_gen(index_names[index])
             else:
                 name = index.name
-            self.index_extent[name] = index.extent
+            index_extent[name] = index.extent
             indices.append(p.Variable(name))
         return tuple(indices)
 
     # Generate index from shape
     def pymbolic_multiindex(self, shape):
+        # Index names are keyed by GEM indices, never by extents, so
+        # the default name always applies here.
+        name_gen = self.name_gen
+        index_extent = self.index_extent
         indices = []
         for extent in shape:
-            name = self.name_gen(self.index_names[extent])
-            self.index_extent[name] = extent
+            name = name_gen("i")
+            index_extent[name] = extent
             indices.append(p.Variable(name))
         return tuple(indices)
 
@@ -165,25 +201,37 @@ class LoopyContext(object):
 
     # Generate pym variable or subscript
     def pymbolic_variable(self, node):
-        pym = self._gem_to_pym_var(node)
-        if node in self.indices:
-            indices = self.fetch_multiindex(self.indices[node])
-            if indices:
-                return p.Subscript(pym, indices)
+        return self.subscript_variable(node, self._gem_to_pym_var(node))
+
+    # Subscript pym variable of node with its declaration indices
+    def subscript_variable(self, node, pym):
+        try:
+            multiindex = self.indices[node]
+        except KeyError:
+            return pym
+        indices = self.fetch_multiindex(multiindex)
+        if indices:
+            return p.Subscript(pym, indices)
         return pym
 
     def _gem_to_pym_var(self, node):
         try:
             pym = self.gem_to_pymbolic[node]
         except KeyError:
-            name = self.name_gen(node.name)
+            if node.name in self.arg_names:
+                # Kernel arguments are referenced by their declared name
+                name = node.name
+            else:
+                name = self.name_gen(node.name)
             pym = p.Variable(name)
             self.gem_to_pymbolic[node] = pym
         return pym
 
     def active_inames(self):
         # Return all active indices
-        return frozenset([i.name for i in self.active_indices.values()])
+        if self._active_inames is None:
+            self._active_inames = frozenset([i.name for i in self.active_indices.values()])
+        return self._active_inames
 
 
 @contextmanager
@@ -193,9 +241,11 @@ def active_indices(mapping, ctx):
    :arg ctx: code generation context.
    :returns: new code generation context."""
     ctx.active_indices.update(mapping)
+    ctx._active_inames = None
     yield ctx
     for key in mapping:
         ctx.active_indices.pop(key)
+    ctx._active_inames = None
 
 
 def generate(impero_c, args, scalar_type, kernel_name="loopy_kernel", index_names=[],
@@ -214,7 +264,7 @@ def generate(impero_c, args, scalar_type, kernel_name="loopy_kernel", index_name
     ctx = LoopyContext(target=target)
     ctx.indices = impero_c.indices
     ctx.index_names = defaultdict(lambda: "i", index_names)
-    ctx.epsilon = numpy.finfo(scalar_type).resolution
+    ctx.epsilon = _finfo(scalar_type).resolution
     ctx.scalar_type = scalar_type
     ctx.return_increments = return_increments
 
@@ -228,6 +278,11 @@ def generate(impero_c, args, scalar_type, kernel_name="loopy_kernel", index_name
             shape = tuple([i.extent for i in ctx.indices[temp]]) + temp.shape
             data.append(lp.TemporaryVariable(name, shape=shape, dtype=dtype, initializer=None, address_space=lp.AddressSpace.LOCAL, read_only=False))
         ctx.gem_to_pymbolic[temp] = p.Variable(name)
+    # Argument and temporary names are fixed, so they bypass the name
+    # generator; register them in one go so that generated index and
+    # variable names cannot clash with them.
+    ctx.arg_names = frozenset(arg.name for arg in args)
+    ctx.name_gen.add_names([arg.name for arg in data])
 
     # Create instructions
     instructions = statement(impero_c.tree, ctx)
@@ -238,13 +293,17 @@ def generate(impero_c, args, scalar_type, kernel_name="loopy_kernel", index_name
     # Create domains
     domains = create_domains(ctx.index_extent.items())
 
+    # Prevent loopy interchange by loopy
+    if ctx.index_extent:
+        loop_priority = frozenset([tuple(ctx.index_extent.keys())])
+    else:
+        loop_priority = frozenset()
+
     # Create loopy kernel
     knl = lp.make_function(domains, instructions, data, name=kernel_name, target=target,
                            seq_dependencies=True, silenced_warnings=["summing_if_branches_ops"],
-                           lang_version=(2018, 2), preambles=preamble)
-
-    # Prevent loopy interchange by loopy
-    knl = lp.prioritize_loops(knl, ",".join(ctx.index_extent.keys()))
+                           lang_version=(2018, 2), preambles=preamble,
+                           loop_priority=loop_priority)
 
     return knl, event_name
 
@@ -255,17 +314,21 @@ def create_domains(indices):
     :arg indices: iterable of (index_name, extent) pairs
     :returns: A list of ISL sets representing the iteration domain of the indices."""
 
-    domains = []
-    for idx, extent in indices:
-        inames = isl.make_zero_and_vars([idx])
-        domains.append(((inames[0].le_set(inames[idx])) & (inames[idx].lt_set(inames[0] + extent))))
+    indices = list(indices)
+    if not indices:
+        return [isl.BasicSet("[] -> {[]}")]
 
-    if not domains:
-        domains = [isl.BasicSet("[] -> {[]}")]
-    return domains
+    # All loops are rectangular, so a single box set describes the
+    # whole iteration domain.
+    inames = isl.make_zero_and_vars([idx for idx, extent in indices])
+    zero = inames[0]
+    domain = reduce(operator.and_,
+                    (zero.le_set(inames[idx]) & inames[idx].lt_set(zero + extent)
+                     for idx, extent in indices))
+    return [domain]
 
 
-@singledispatch
+@fast_singledispatch
 def statement(tree, ctx):
     """Translates an Impero (sub)tree into a loopy instructions corresponding
     to a C statement.
@@ -327,8 +390,15 @@ def statement_evaluate(leaf, ctx):
     if isinstance(expr, gem.ListTensor):
         ops = []
         var, index = ctx.pymbolic_variable_and_destruct(expr)
-        for multiindex, value in numpy.ndenumerate(expr.array):
-            ops.append(lp.Assignment(p.Subscript(var, index + multiindex), expression(value, ctx), within_inames=ctx.active_inames()))
+        inames = ctx.active_inames()
+        array = expr.array
+        if array.ndim == 1:
+            # Common case, avoid the generic multiindex iterator
+            multiindices = ((k,) for k in range(len(array)))
+        else:
+            multiindices = numpy.ndindex(array.shape)
+        for multiindex, value in zip(multiindices, array.flat):
+            ops.append(lp.Assignment(p.Subscript(var, index + multiindex), expression(value, ctx), within_inames=inames))
         return ops
     elif isinstance(expr, gem.Constant):
         return []
@@ -374,13 +444,15 @@ def expression(expr, ctx, top=False):
     :arg top: do not generate temporary reference for the root node
     :returns: pymbolic expression
     """
-    if not top and expr in ctx.gem_to_pymbolic:
-        return ctx.pymbolic_variable(expr)
-    else:
-        return _expression(expr, ctx)
+    if not top:
+        # Single dict lookup for the common case of a temporary
+        pym = ctx.gem_to_pymbolic.get(expr)
+        if pym is not None:
+            return ctx.subscript_variable(expr, pym)
+    return _expression(expr, ctx)
 
 
-@singledispatch
+@fast_singledispatch
 def _expression(expr, ctx):
     raise AssertionError("cannot generate expression from %s" % type(expr))
 
@@ -392,22 +464,26 @@ def _expression_failure(expr, ctx):
 
 @_expression.register(gem.Product)
 def _expression_product(expr, ctx):
-    return p.Product(tuple(expression(c, ctx) for c in expr.children))
+    a, b = expr.children
+    return p.Product((expression(a, ctx), expression(b, ctx)))
 
 
 @_expression.register(gem.Sum)
 def _expression_sum(expr, ctx):
-    return p.Sum(tuple(expression(c, ctx) for c in expr.children))
+    a, b = expr.children
+    return p.Sum((expression(a, ctx), expression(b, ctx)))
 
 
 @_expression.register(gem.Division)
 def _expression_division(expr, ctx):
-    return p.Quotient(*(expression(c, ctx) for c in expr.children))
+    a, b = expr.children
+    return p.Quotient(expression(a, ctx), expression(b, ctx))
 
 
 @_expression.register(gem.Power)
 def _expression_power(expr, ctx):
-    return p.Variable("pow")(*(expression(c, ctx) for c in expr.children))
+    base, exponent = expr.children
+    return p.Variable("pow")(expression(base, ctx), expression(exponent, ctx))
 
 
 @_expression.register(gem.MathFunction)
@@ -522,12 +598,18 @@ def _expression_flexiblyindexed(expr, ctx):
 
     rank = []
     for off, idxs in expr.dim2idxs:
+        rank_ = [off] if off else []
         for index, stride in idxs:
             assert isinstance(index, gem.Index)
-
-        rank_ = [off]
-        for index, stride in idxs:
-            rank_.append(p.Product((ctx.active_indices[index], stride)))
-        rank.append(p.Sum(tuple(rank_)))
+            iname = ctx.active_indices[index]
+            # Unit strides are by far the most common
+            rank_.append(iname if stride == 1 else p.Product((iname, stride)))
+
+        if len(rank_) > 1:
+            rank.append(p.Sum(tuple(rank_)))
+        elif rank_:
+            rank.append(rank_[0])
+        else:
+            rank.append(0)
 
     return p.Subscript(var, tuple(rank))
@@ -1,11 +1,11 @@
 from collections import OrderedDict, defaultdict, namedtuple
-from functools import partial, reduce
+from functools import partial
 from itertools import chain, zip_longest
 
-from gem.gem import Delta, Indexed, Sum, index_sum, one
+from gem.gem import Delta, Indexed, index_sum, one
 from gem.node import Memoizer
 from gem.optimise import delta_elimination as _delta_elimination
-from gem.optimise import remove_componenttensors, replace_division, unroll_indexsum
+from gem.optimise import balanced_sum, remove_componenttensors, replace_division, unroll_indexsum
 from gem.refactorise import ATOMIC, COMPOUND, OTHER, MonomialSum, collect_monomials
 from gem.unconcatenate import unconcatenate
 from gem.coffee import optimise_monomial_sum
@@ -66,7 +66,7 @@ def flatten(var_reps, index_cache):
                    for e in expressions)
 
         # Save assignment pair
-        pairs.append((variable, reduce(Sum, expressions)))
+        pairs.append((variable, balanced_sum(expressions)))
 
         # Collect quadrature_indices
         for r in reps:
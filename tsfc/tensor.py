@@ -1,11 +1,11 @@
 from collections import defaultdict
-from functools import partial, reduce
+from functools import partial
 from itertools import count
 
 import numpy
 
 import gem
-from gem.optimise import remove_componenttensors, unroll_indexsum
+from gem.optimise import balanced_sum, remove_componenttensors, unroll_indexsum
 from gem.refactorise import ATOMIC, COMPOUND, OTHER, collect_monomials
 from gem.unconcatenate import flatten as concatenate
 
@@ -79,7 +79,7 @@ def Integrals(expressions, quadrature_multiindex, argument_multiindices, paramet
                 replacement = gem.Literal(1)
             # Rebuild expression
             products.append(gem.IndexSum(gem.Product(replacement, rest), sum_indices))
-        result.append(reduce(gem.Sum, products, gem.Zero()))
+        result.append(balanced_sum(products))
     return result
 
 
@@ -1,6 +1,5 @@
 """Translation of UFL tensor-algebra into GEM tensor-algebra."""
 
-import collections
 import ufl
 
 from gem import (Literal, Zero, Identity, Sum, Product, Division,
@@ -17,9 +16,9 @@ class Mixin(object):
     this mixin."""
 
     def __init__(self):
-        self.index_map = collections.defaultdict(Index)
+        self.index_map = {}
         """A map for translating UFL free indices into GEM free
-        indices."""
+        indices, keyed by UFL index count."""
 
     def scalar_value(self, o):
         return Literal(o.value())
@@ -122,12 +121,18 @@ class Mixin(object):
             return Conditional(condition, then, else_)
 
     def multi_index(self, o):
+        index_map = self.index_map
         indices = []
         for i in o:
             if isinstance(i, ufl.classes.FixedIndex):
                 indices.append(int(i))
             elif isinstance(i, ufl.classes.Index):
-                indices.append(self.index_map[i.count()])
+                count = i.count()
+                try:
+                    index = index_map[count]
+                except KeyError:
+                    index = index_map[count] = Index()
+                indices.append(index)
         return tuple(indices)
 
     def indexed(self, o, aggregate, index):
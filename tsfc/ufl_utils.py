@@ -1,6 +1,6 @@
 """Utilities for preprocessing UFL objects."""
 
-from functools import singledispatch
+from itertools import product
 
 import numpy
 
@@ -26,6 +26,7 @@ from ufl.classes import (Abs, Argument, CellOrientation, Coefficient,
                          ScalarValue, Sqrt, Zero, CellVolume, FacetArea)
 
 from gem.node import MemoizerArg
+from gem.utils import fast_singledispatch
 
 from tsfc.modified_terminals import (is_modified_terminal,
                                      analyse_modified_terminal,
@@ -63,7 +64,24 @@ def compute_form_data(form,
     return fd
 
 
-def one_times(measure):
+def one_times(measure, cache=None):
+    """Preprocess ``1*measure``, returning the integrand and its
+    estimated degree.
+
+    :arg cache: optional :py:class:`dict` for sharing results between
+        calls, keyed by the measure
+    """
+    if cache is None:
+        return _one_times(measure)
+    try:
+        return cache[measure]
+    except KeyError:
+        result = _one_times(measure)
+        cache[measure] = result
+        return result
+
+
+def _one_times(measure):
     # Workaround for UFL issue #80:
     # https://bitbucket.org/fenics-project/ufl/issues/80
     form = 1 * measure
@@ -88,9 +106,10 @@ def entity_avg(integrand, measure, argument_multiindices):
     arguments = extract_arguments(integrand)
     if len(arguments) == 1:
         a, = arguments
-        integrand = ufl.replace(integrand, {a: ufl.Argument(a.function_space(),
-                                                            number=0,
-                                                            part=a.part())})
+        if a.number() != 0:
+            integrand = ufl.replace(integrand, {a: ufl.Argument(a.function_space(),
+                                                                number=0,
+                                                                part=a.part())})
         argument_multiindices = (argument_multiindices[a.number()], )
 
     degree = estimate_total_polynomial_degree(integrand)
@@ -122,8 +141,12 @@ def preprocess_expression(expression, complex_mode=False,
     expression = apply_function_pullbacks(expression)
     expression = apply_geometry_lowering(expression, preserve_geometry_types)
     expression = apply_derivatives(expression)
-    expression = apply_geometry_lowering(expression, preserve_geometry_types)
-    expression = apply_derivatives(expression)
+    lowered = apply_geometry_lowering(expression, preserve_geometry_types)
+    # Geometry lowering returns the very same object if it had nothing
+    # to lower.  Derivatives have just been applied, so applying them
+    # again would then be a wasted traversal.
+    if lowered is not expression:
+        expression = apply_derivatives(lowered)
     if not complex_mode:
         expression = remove_complex_nodes(expression)
     if do_apply_restrictions:
@@ -164,9 +187,20 @@ class ModifiedTerminalMixin(object):
 
 
 class CoefficientSplitter(MultiFunction, ModifiedTerminalMixin):
+    __slots__ = ('_split', '_alphas')
+
     def __init__(self, split):
         MultiFunction.__init__(self)
         self._split = split
+        self._alphas = {}  # reference value shape -> component multiindices
+
+    def _component_multiindices(self, shape):
+        try:
+            return self._alphas[shape]
+        except KeyError:
+            alphas = tuple(product(*map(range, shape)))
+            self._alphas[shape] = alphas
+            return alphas
 
     expr = MultiFunction.reuse_if_untouched
 
@@ -193,9 +227,10 @@ class CoefficientSplitter(MultiFunction, ModifiedTerminalMixin):
             # Apply terminal modifiers onto the subcoefficient
             component = construct_modified_terminal(mt, subcoeff)
             # Collect components of the subcoefficient
-            for alpha in numpy.ndindex(subcoeff.ufl_element().reference_value_shape()):
-                # New modified terminal: component[alpha + beta]
-                components.append(component[alpha + beta])
+            shape = subcoeff.ufl_element().reference_value_shape()
+            # New modified terminals: component[alpha + beta]
+            components.extend(component[alpha + beta]
+                              for alpha in self._component_multiindices(shape))
         # Repack derivative indices to shape
         c, = indices(1)
         return ComponentTensor(as_tensor(components)[c], MultiIndex((c,) + beta))
@@ -206,10 +241,13 @@ def split_coefficients(expression, split):
     implemented.
 
     :arg split: A :py:class:`dict` mapping each mixed coefficient to a
-                sequence of subcoefficients.  If None, calling this
-                function is a no-op.
+                sequence of subcoefficients.  If None or empty, calling
+                this function is a no-op.
+
+    Untouched subexpressions are reused, so an expression without
+    mixed coefficients to split is returned as is.
     """
-    if split is None:
+    if not split:
         return expression
 
     splitter = CoefficientSplitter(split)
@@ -227,6 +265,8 @@ class PickRestriction(MultiFunction, ModifiedTerminalMixin):
     restrictions, or else :class:`ufl.classes.Zero` if no such part
     exists.
     """
+    __slots__ = ('restrictions',)
+
     def __init__(self, test=None, trial=None):
         self.restrictions = {0: test, 1: trial}
         MultiFunction.__init__(self)
@@ -248,13 +288,20 @@ class PickRestriction(MultiFunction, ModifiedTerminalMixin):
 
 def ufl_reuse_if_untouched(o, *ops):
     """Reuse object if operands are the same objects."""
-    if all(a is b for a, b in zip(o.ufl_operands, ops)):
+    operands = o.ufl_operands
+    # Most nodes are unary or binary, avoid the generator for those.
+    if len(ops) == 1:
+        if operands[0] is ops[0]:
+            return o
+    elif len(ops) == 2:
+        if operands[0] is ops[0] and operands[1] is ops[1]:
+            return o
+    elif all(a is b for a, b in zip(operands, ops)):
         return o
-    else:
-        return o._ufl_expr_reconstruct_(*ops)
+    return o._ufl_expr_reconstruct_(*ops)
 
 
-@singledispatch
+@fast_singledispatch
 def _simplify_abs(o, self, in_abs):
     """Single-dispatch function to simplify absolute values.
 
@@ -315,14 +362,8 @@ def _simplify_abs_product(o, self, in_abs):
     ops = [self(op, True) for op in o.ufl_operands]
 
     # Strip Abs off again (we will put it outside now)
-    stripped = False
-    strip_ops = []
-    for op in ops:
-        if isinstance(op, Abs):
-            stripped = True
-            strip_ops.append(op.ufl_operands[0])
-        else:
-            strip_ops.append(op)
+    strip_ops = [op.ufl_operands[0] if type(op) is Abs else op for op in ops]
+    stripped = any(type(op) is Abs for op in ops)
 
     # Rebuild, and wrap with Abs if necessary
     result = ufl_reuse_if_untouched(o, *strip_ops)
@@ -336,12 +377,21 @@ def _simplify_abs_abs(o, self, in_abs):
     return self(o.ufl_operands[0], True)
 
 
-def simplify_abs(expression, complex_mode):
+def simplify_abs(expression, complex_mode, cache=None):
     """Simplify absolute values in a UFL expression.  Its primary
     purpose is to "neutralise" CellOrientation nodes that are
-    surrounded by absolute values and thus not at all necessary."""
+    surrounded by absolute values and thus not at all necessary.
+
+    :arg cache: optional :py:class:`dict` for sharing results between
+        calls with the same ``complex_mode``
+    """
+    if expression._ufl_is_terminal_:
+        # Nothing to simplify outside an absolute value
+        return expression
     mapper = MemoizerArg(_simplify_abs)
     mapper.complex_mode = complex_mode
+    if cache is not None:
+        mapper.cache = cache
     return mapper(expression, False)
 
 
@@ -405,64 +455,93 @@ def apply_mapping(expression, element, domain):
     if expression.ufl_shape != element.value_shape():
         raise ValueError(f"Mismatching shapes, got {expression.ufl_shape}, expected {element.value_shape()}")
     mapping = element.mapping().lower()
-    if mapping == "identity":
-        rexpression = expression
-    elif mapping == "covariant piola":
-        J = Jacobian(mesh)
-        *k, i, j = indices(len(expression.ufl_shape) + 1)
-        kj = (*k, j)
-        rexpression = as_tensor(J[j, i] * expression[kj], (*k, i))
-    elif mapping == "l2 piola":
-        detJ = JacobianDeterminant(mesh)
-        rexpression = expression * detJ
-    elif mapping == "contravariant piola":
-        K = JacobianInverse(mesh)
-        detJ = JacobianDeterminant(mesh)
-        *k, i, j = indices(len(expression.ufl_shape) + 1)
-        kj = (*k, j)
-        rexpression = as_tensor(detJ * K[i, j] * expression[kj], (*k, i))
-    elif mapping == "double covariant piola":
-        J = Jacobian(mesh)
-        *k, i, j, m, n = indices(len(expression.ufl_shape) + 2)
-        kmn = (*k, m, n)
-        rexpression = as_tensor(J[m, i] * expression[kmn] * J[n, j], (*k, i, j))
-    elif mapping == "double contravariant piola":
-        K = JacobianInverse(mesh)
-        detJ = JacobianDeterminant(mesh)
-        *k, i, j, m, n = indices(len(expression.ufl_shape) + 2)
-        kmn = (*k, m, n)
-        rexpression = as_tensor(detJ**2 * K[i, m] * expression[kmn] * K[j, n], (*k, i, j))
-    elif mapping == "symmetries":
-        # This tells us how to get from the pieces of the reference
-        # space expression to the physical space one.
-        # We're going to apply the inverse of the physical to
-        # reference space mapping.
-        fcm = element.flattened_sub_element_mapping()
-        sub_elem = element.sub_elements()[0]
-        shape = expression.ufl_shape
-        flat = ufl.as_vector([expression[i] for i in numpy.ndindex(shape)])
-        vs = sub_elem.value_shape()
-        rvs = sub_elem.reference_value_shape()
-        seen = set()
-        rpieces = []
-        gm = int(numpy.prod(vs, dtype=int))
-        for gi, ri in enumerate(fcm):
-            # For each unique piece in reference space
-            if ri in seen:
-                continue
-            seen.add(ri)
-            # Get the physical space piece
-            piece = [flat[gm*gi + j] for j in range(gm)]
-            piece = as_tensor(numpy.asarray(piece).reshape(vs))
-            # get into reference space
-            piece = apply_mapping(piece, sub_elem, mesh)
-            assert piece.ufl_shape == rvs
-            # Concatenate with the other pieces
-            rpieces.extend([piece[idx] for idx in numpy.ndindex(rvs)])
-        # And reshape
-        rexpression = as_tensor(numpy.asarray(rpieces).reshape(element.reference_value_shape()))
-    else:
+    apply = _mapping_handlers.get(mapping)
+    if apply is None:
         raise NotImplementedError(f"Don't know how to handle mapping type {mapping} for expression of rank {element.value_shape()}")
+    rexpression = apply(expression, element, mesh)
     if rexpression.ufl_shape != element.reference_value_shape():
         raise ValueError(f"Mismatching reference shapes, got {rexpression.ufl_shape} expected {element.reference_value_shape()}")
     return rexpression
+
+
+def _apply_identity(expression, element, mesh):
+    return expression
+
+
+def _apply_covariant_piola(expression, element, mesh):
+    J = Jacobian(mesh)
+    *k, i, j = indices(len(expression.ufl_shape) + 1)
+    kj = (*k, j)
+    return as_tensor(J[j, i] * expression[kj], (*k, i))
+
+
+def _apply_l2_piola(expression, element, mesh):
+    detJ = JacobianDeterminant(mesh)
+    return expression * detJ
+
+
+def _apply_contravariant_piola(expression, element, mesh):
+    K = JacobianInverse(mesh)
+    detJ = JacobianDeterminant(mesh)
+    *k, i, j = indices(len(expression.ufl_shape) + 1)
+    kj = (*k, j)
+    return as_tensor(detJ * K[i, j] * expression[kj], (*k, i))
+
+
+def _apply_double_covariant_piola(expression, element, mesh):
+    J = Jacobian(mesh)
+    *k, i, j, m, n = indices(len(expression.ufl_shape) + 2)
+    kmn = (*k, m, n)
+    return as_tensor(J[m, i] * expression[kmn] * J[n, j], (*k, i, j))
+
+
+def _apply_double_contravariant_piola(expression, element, mesh):
+    K = JacobianInverse(mesh)
+    detJ = JacobianDeterminant(mesh)
+    *k, i, j, m, n = indices(len(expression.ufl_shape) + 2)
+    kmn = (*k, m, n)
+    return as_tensor(detJ**2 * K[i, m] * expression[kmn] * K[j, n], (*k, i, j))
+
+
+def _apply_symmetries(expression, element, mesh):
+    # This tells us how to get from the pieces of the reference
+    # space expression to the physical space one.
+    # We're going to apply the inverse of the physical to
+    # reference space mapping.
+    fcm = element.flattened_sub_element_mapping()
+    sub_elem = element.sub_elements()[0]
+    shape = expression.ufl_shape
+    flat = ufl.as_vector([expression[i] for i in product(*map(range, shape))])
+    vs = sub_elem.value_shape()
+    rvs = sub_elem.reference_value_shape()
+    seen = set()
+    rpieces = []
+    gm = int(numpy.prod(vs, dtype=int))
+    for gi, ri in enumerate(fcm):
+        # For each unique piece in reference space
+        if ri in seen:
+            continue
+        seen.add(ri)
+        # Get the physical space piece
+        piece = [flat[gm*gi + j] for j in range(gm)]
+        piece = as_tensor(numpy.asarray(piece).reshape(vs))
+        # get into reference space
+        piece = apply_mapping(piece, sub_elem, mesh)
+        assert piece.ufl_shape == rvs
+        # Concatenate with the other pieces
+        rpieces.extend([piece[idx] for idx in product(*map(range, rvs))])
+    # And reshape
+    return as_tensor(numpy.asarray(rpieces).reshape(element.reference_value_shape()))
+
+
+# Lower-cased mapping name -> function(expression, element, mesh)
+# returning the reference space expression.
+_mapping_handlers = {
+    "identity": _apply_identity,
+    "covariant piola": _apply_covariant_piola,
+    "l2 piola": _apply_l2_piola,
+    "contravariant piola": _apply_contravariant_piola,
+    "double covariant piola": _apply_double_covariant_piola,
+    "double contravariant piola": _apply_double_contravariant_piola,
+    "symmetries": _apply_symmetries,
+}
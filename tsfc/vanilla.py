@@ -1,7 +1,5 @@
-from functools import reduce
-
-from gem import index_sum, Sum
-from gem.optimise import unroll_indexsum
+from gem import index_sum
+from gem.optimise import balanced_sum, unroll_indexsum
 from gem.unconcatenate import unconcatenate
 
 
@@ -37,7 +35,7 @@ def flatten(var_reps, index_cache):
 
     :returns: series of (return variable, GEM expression root) pairs
     """
-    return unconcatenate([(variable, reduce(Sum, reps))
+    return unconcatenate([(variable, balanced_sum(reps))
                           for variable, reps in var_reps],
                          cache=index_cache)
 